@@ -0,0 +1,194 @@
+# python standard library dependencies
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+from logging import Logger
+from typing import Any
+
+
+# default cache output directory
+CACHE_DEFAULT_DIR = r"./cache"
+
+
+class PersistentCache:
+    """A thread-safe cache of JSON-serializable values that is persisted to a .json file between runs
+    """
+
+    def __init__(self, path: str, ttl: float | None = None, logger: Logger = None):
+        r"""Creates a new ``PersistentCache`` object, loading any unexpired entries previously saved at ``path``
+
+        :param str path: the path of the .json file backing the cache
+        :param float | None ttl: the number of seconds after which an entry expires, defaults to None (never)
+        :param Logger logger: a logger, defaults to None
+        """
+
+        self.path = path
+        self.ttl = ttl
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._dirty = False
+
+        # each entry is stored as a [timestamp, value] pair
+        # a cache that can't be read is treated as empty, since it only saves requests
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+
+        if not isinstance(entries, dict):
+            entries = {}
+
+        # malformed entries (e.g. from a cache written before entries were timestamped) are dropped, as are expired ones
+        self._entries: dict[str, list[Any]] = {
+            key: entry for key, entry in entries.items()
+            if isinstance(entry, list) and len(entry) == 2 and isinstance(entry[0], (int, float)) and not self._is_expired(entry)
+        }
+        self._dirty = len(self._entries) != len(entries)
+
+    def __enter__(self) -> "PersistentCache":
+        return self
+
+    def __exit__(self, *args):
+        self.save()
+
+    def get(self, key: str) -> Any | None:
+        """Gets a cached value
+
+        :param str key: the key of the value
+        :return Any | None: the cached value, or None if there is none
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or self._is_expired(entry):
+            return None
+
+        return entry[1]
+
+    def set(self, key: str, value: Any):
+        """Caches a value
+
+        :param str key: the key of the value
+        :param Any value: a JSON-serializable value
+        """
+
+        with self._lock:
+            self._entries[key] = [time.time(), value]
+            self._dirty = True
+
+    def save(self) -> bool:
+        """Writes the cache to its .json file if it has changed since it was loaded
+
+        Failing to write the cache only means requests are made again next run, so errors are logged instead of raised.
+
+        :return bool: whether the cache is saved
+        """
+
+        with self._lock:
+            if not self._dirty:
+                return True
+
+            # written to a temporary file first so an interrupted write never corrupts the cache
+            # the temporary file is unique, so runs saving the same cache at the same time don't replace each other's
+            temp = None
+            try:
+                directory = os.path.dirname(self.path) or '.'
+                os.makedirs(directory, exist_ok=True)
+                with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, suffix=".tmp", delete=False) as f:
+                    temp = f.name
+                    json.dump(self._entries, f)
+                os.replace(temp, self.path)
+            except (OSError, TypeError, ValueError) as e:
+                if self.logger:
+                    self.logger.error("unable to save cache %s: %s", self.path, e)
+                if temp:
+                    try:
+                        os.remove(temp)
+                    except OSError:
+                        pass
+                return False
+
+            self._dirty = False
+            return True
+
+    def _is_expired(self, entry: list[Any]) -> bool:
+        """Checks whether a [timestamp, value] entry is older than the cache's TTL
+
+        :param list[Any] entry: a [timestamp, value] entry
+        :return bool: whether the entry has expired
+        """
+
+        return self.ttl is not None and time.time() - entry[0] > self.ttl
+
+
+class DownloadCache:
+    """A record of the tracks downloaded from a playlist, persisted to an SQLite database so they aren't downloaded again in later runs
+    """
+
+    def __init__(self, path: str, platform: str, playlist_id: str):
+        r"""Creates a new ``DownloadCache`` object
+
+        :param str path: the path of the SQLite database
+        :param str platform: the platform on which the playlist exists
+        :param str playlist_id: the ID of the playlist
+        """
+
+        self.platform = platform
+        self.playlist_id = playlist_id
+        self._lock = threading.Lock()
+
+        # the connection is shared by the worker threads, so access to it is serialized by the lock instead
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS tracks(platform TEXT, playlist TEXT, id TEXT, path TEXT, mtime REAL, PRIMARY KEY(platform, playlist, id))")
+
+    def __enter__(self) -> "DownloadCache":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def is_downloaded(self, track_id: str) -> bool:
+        """Checks whether a track was downloaded before and its file hasn't changed since
+
+        :param str track_id: the ID of the track on the playlist's platform
+        :return bool: whether the track can be skipped
+        """
+
+        with self._lock:
+            row = self._conn.execute("SELECT path, mtime FROM tracks WHERE platform = ? AND playlist = ? AND id = ?", (self.platform, self.playlist_id, track_id)).fetchone()
+
+        if not row:
+            return False
+
+        path, mtime = row
+        try:
+            return os.path.getmtime(path) == mtime
+        except OSError:
+            return False
+
+    def add(self, track_id: str, path: str):
+        """Records a downloaded track
+
+        :param str track_id: the ID of the track on the playlist's platform
+        :param str path: the path of the downloaded file
+        """
+
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            # committed right away so the database's write lock isn't held for the rest of the run,
+            # which would lock out other runs recording their tracks at the same time
+            self._conn.execute("INSERT OR REPLACE INTO tracks VALUES (?, ?, ?, ?, ?)", (self.platform, self.playlist_id, track_id, path, mtime))
+            self._conn.commit()
+
+    def close(self):
+        """Closes the database
+        """
+
+        with self._lock:
+            self._conn.close()
@@ -2,29 +2,90 @@
 import os
 import logging
 import shlex
+import sqlite3
 import tomllib
+import copy
+import functools
+import hashlib
+import json
+import queue
+import threading
 import datetime as dt
 from logging import Logger
-from urllib.request import urlopen
+from logging.handlers import QueueHandler, QueueListener
 from enum import Enum
+from dataclasses import dataclass, field, fields
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from collections.abc import Callable, Iterable, Iterator
 from typing import Any
 
 # external dependencies
 import yt_dlp as yt
 import ytmusicapi as ytm
 import music_tag
+import requests
 import spotipy as sp
 from spotipy.oauth2 import SpotifyClientCredentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ytmusicapi import YTMusic
 
+# internal dependencies
+from .ratelimit import TokenBucket, with_backoff
+from .cache import CACHE_DEFAULT_DIR, DownloadCache, PersistentCache
+
 # TODO:
-# - output logs to console if `genlogs` is false
 # - integrate thumbnail quality option for spotify as well
 
 
 # default log output directory
 LOG_DEFAULT_DIR = r"./log"
 
+# default number of tracks processed at the same time
+CONCURRENCY_DEFAULT = 4
+
+# default number of hours after which cached albums and searches are retrieved again
+ALBUM_TTL_DEFAULT = 24
+SEARCH_TTL_DEFAULT = 1
+
+# format of log messages and of their timestamps
+LOG_FORMAT = "%(asctime)s %(levelname)s: %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S (%Z)"
+
+# the logger every run logs to, whose handlers are attached and removed per run
+_LOGGER = logging.getLogger(__name__)
+
+# the tables of an empty config, used when no config file is supplied
+_DEFAULT_CONFIG_TOML = "[playlist-master]\n\n[yt-dlp]\n\n[yt-oauth]\n\n[sp-oauth]\n"
+
+# parsed config files keyed by absolute path, along with the (mtime, size) they were parsed at
+_TOML_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# authenticated Youtube Music clients keyed by their serialized credentials
+_YTMUSIC_CLIENTS: dict[str, YTMusic] = {}
+
+# the url prefix of a Youtube Music track, to which a video id is appended
+_YT_WATCH_URL = "https://music.youtube.com/watch?v="
+
+# the maximum number of items the Spotify Web API returns per page of a playlist
+_SPOTIFY_PAGE_LIMIT = 100
+
+# the only fields of a playlist page that are used, which keeps responses from the Spotify Web API small
+# keep in sync with `get_spotify_track_info`
+_SPOTIFY_PLAYLIST_FIELDS = "total,items(track(id,name,explicit,track_number,disc_number,artists(name),album(name,album_type,release_date,total_tracks,images,artists(name))))"
+
+# limits Youtube Music searches to 10 per second across all worker threads
+_SEARCH_BUCKET = TokenBucket(rate=10, per=1.0)
+
+# replaces the characters that can't appear in a file or directory name on common file systems
+# and escapes `%`, which yt-dlp would otherwise read as the start of an output template field
+_PATH_TRANSLATION = str.maketrans({**dict.fromkeys('/\\:*?"<>|', "_"), "%": "%%"})
+
+# shared session for downloading cover art so connections to the same CDN host are kept alive and reused
+_ART_SESSION = requests.Session()
+_ART_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])))
+
 
 class ThumbnailQuality(Enum):
     """An enumeration representing thumbnail qualities to interface with the Youtube Data API V3
@@ -37,18 +98,13 @@ class ThumbnailQuality(Enum):
     MAXRES = 4
 
 
-class YtDlpLogger:
+class YtDlpLogger(logging.LoggerAdapter):
     """A logger object to be used by yt-dlp
-    """
 
-    def __init__(self, logger: Logger):
-        r"""Creates a new ``YtDlpLogger object
-
-        :param Logger logger: a ``Logger`` object that will be the actual logger
-        """
-        self.logger = logger
+    ``info``, ``warning`` and ``error`` are passed straight through to the adapted ``Logger``.
+    """
 
-    def debug(self, msg: str):
+    def debug(self, msg: str, *args, **kwargs):
         """Logs a debug message
 
         :param str msg: the message to log
@@ -56,68 +112,320 @@ class YtDlpLogger:
 
         # For compatibility with youtube-dl, both debug and info are passed into debug
         # You can distinguish them by the prefix '[debug] '
-        if msg.startswith('[debug] '):
-            pass
-        else:
-            self.info(msg)
+        # each message is logged exactly once, at the level it was meant for
+        self.log(logging.DEBUG if msg.startswith('[debug] ') else logging.INFO, msg, *args, **kwargs)
 
-        self.logger.debug(msg)
 
-    def info(self, msg: str):
-        """Logs an info message
+class YtDlpDownloader:
+    """A reusable ``YoutubeDL`` object that keeps track of the files it downloads
+    """
 
-        :param str msg: the message to log
+    def __init__(self, options: dict[str, Any]):
+        r"""Creates a new ``YtDlpDownloader`` object
+
+        :param dict[str, Any] options: yt-dlp options, which are not modified
         """
 
-        self.logger.info(msg)
+        # the output template is copied since it's modified per track when sorting
+        self.ytdl = yt.YoutubeDL(dict(options, outtmpl=dict(options["outtmpl"])))
+        self.default_outtmpl = self.ytdl.params["outtmpl"]["default"]
 
-    def warning(self, msg: str):
-        """Logs a warning message
+        # split once so that sorted output templates can be built without rescanning the template for every track
+        i = max(self.default_outtmpl.rfind('/'), self.default_outtmpl.rfind('\\')) + 1
+        self.outtmpl_dir = self.default_outtmpl[:i]
+        self.outtmpl_name = self.default_outtmpl[i:]
 
-        :param str msg: the message to log
+        self.outputs: list[str] = []
+        self.ytdl.add_post_hook(self.outputs.append)
+
+    def __enter__(self) -> "YtDlpDownloader":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def download(self, url: str, outtmpl: str = None) -> str | None:
+        """Downloads a track from Youtube at ``url``
+
+        :param str url: the url of the track
+        :param str outtmpl: the output template to download the track to, defaults to the one in the yt-dlp options
+        :return str | None: the path of the downloaded file, or None if nothing was downloaded
         """
 
-        self.logger.warning(msg)
+        self.outputs.clear()
+        self.ytdl.params["outtmpl"]["default"] = outtmpl or self.default_outtmpl
+        self.ytdl.download([url])
+        return self.outputs[-1] if self.outputs else None
 
-    def error(self, msg: str):
-        """Logs an error message
+    def close(self):
+        """Closes the underlying ``YoutubeDL`` object
+        """
 
-        :param str msg: the message to log
+        self.ytdl.close()
+
+
+class YtDlpPool:
+    """A pool of ``YtDlpDownloader`` objects, each used by at most one thread at a time
+
+    ``YoutubeDL`` objects are expensive to create and not thread-safe, so every worker thread reuses one from the pool.
+    """
+
+    def __init__(self, options: dict[str, Any], rate_limit: float | None = None):
+        r"""Creates a new ``YtDlpPool`` object
+
+        :param dict[str, Any] options: yt-dlp options used by every downloader in the pool
+        :param float | None rate_limit: the maximum number of downloads to start per second across all threads, defaults to None (no limit)
         """
 
-        self.logger.error(msg)
+        self.options = options
+        self._bucket = TokenBucket(rate_limit) if rate_limit else None
+        self._idle: queue.SimpleQueue[YtDlpDownloader] = queue.SimpleQueue()
+        self._downloaders: list[YtDlpDownloader] = []
 
+    def __enter__(self) -> "YtDlpPool":
+        return self
 
-class Track:
-    """A class representing a song/track
-    """
-
-    def __init__(self, artists: list[str], album_artists: list[str], title: str, album_title: str, release_date: str, art_url: str, track_number: int, total_tracks: int, disc_number: int, explicit: bool = False):
-        r"""Creates a new ``Track`` object
-
-        :param list[str] artists: the artists of the track
-        :param list[str] album_artists: the artists of the album the track belongs to
-        :param str title: the title of the track
-        :param str album_title: the title of the album the track belongs to
-        :param str release_date: the release date in the form 'yyyy-mm-dd'
-        :param str art_url: the url of the album's (or song's) cover art
-        :param int track_number: the track number in the album
-        :param int total_tracks: the total number of tracks in the album
-        :param int disc_number: the disc number the track belongs to
-        :param bool explicit: whether the track contains profanity or is considered 'explicit', defaults to False
+    def __exit__(self, *args):
+        self.close()
+
+    @contextmanager
+    def acquire(self) -> Iterator[YtDlpDownloader]:
+        """Borrows an idle downloader from the pool, creating one if there are none
+
+        If the pool is rate limited, this first blocks until another download may start.
+        Tracks skipped before downloading never borrow a downloader, so they don't count towards the limit.
+
+        :yield YtDlpDownloader: a downloader that isn't in use by any other thread
         """
 
-        self.artists = artists
-        self.album_artists = album_artists
-        self.title = title
-        self.album_title = album_title
-        self.release_date = release_date
-        self.art_url = art_url
-        self.track_number = track_number
-        self.total_tracks = total_tracks
-        self.disc_number = disc_number
-        self.explicit = explicit
-    
+        if self._bucket:
+            self._bucket.acquire()
+
+        try:
+            downloader = self._idle.get_nowait()
+        except queue.Empty:
+            downloader = YtDlpDownloader(self.options)
+            self._downloaders.append(downloader)
+
+        try:
+            yield downloader
+        finally:
+            self._idle.put(downloader)
+
+    def close(self):
+        """Closes every downloader in the pool
+        """
+
+        for downloader in self._downloaders:
+            downloader.close()
+
+
+class SeenSet:
+    """A thread-safe set that tells whether an item was already added to it, so duplicates are only processed once
+    """
+
+    def __init__(self):
+        r"""Creates a new, empty ``SeenSet`` object
+        """
+
+        self._items: set[Any] = set()
+        self._lock = threading.Lock()
+
+    def add(self, item: Any) -> bool:
+        """Adds an item to the set
+
+        :param Any item: a hashable item
+        :return bool: whether the item is new, i.e. it wasn't added before
+        """
+
+        with self._lock:
+            if item in self._items:
+                return False
+
+            self._items.add(item)
+            return True
+
+
+class ArtworkPrefetcher:
+    """Downloads cover art in the background so it's ready by the time its track has been downloaded
+
+    Tracks with the same cover art share a single download.
+    """
+
+    def __init__(self, max_workers: int = 8, cachedir: str = None):
+        r"""Creates a new ``ArtworkPrefetcher`` object
+
+        :param int max_workers: the maximum number of cover arts to download at the same time, defaults to 8
+        :param str cachedir: the directory in which to cache cover art between runs, defaults to None
+        """
+
+        self.cachedir = cachedir
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures: dict[str, Future[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "ArtworkPrefetcher":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def prefetch(self, url: str) -> Future[bytes]:
+        """Starts downloading cover art if it isn't already being downloaded
+
+        :param str url: the url of the cover art
+        :return Future[bytes]: the pending cover art
+        """
+
+        with self._lock:
+            future = self._futures.get(url)
+            if not future:
+                future = self._executor.submit(fetch_artwork, url, self.cachedir)
+                self._futures[url] = future
+            return future
+
+    def close(self):
+        """Stops downloading any cover art that hasn't started downloading yet
+        """
+
+        self._executor.shutdown(cancel_futures=True)
+
+
+class AlbumFetcher:
+    """Gets the Youtube albums of a playlist's tracks, retrieving each album only once per run
+
+    Tracks of the same album tend to be next to each other in a playlist, so several workers often ask for the same album at once.
+    Only the first one retrieves it, while the others wait for its result.
+    """
+
+    def __init__(self, credentials: YTMusic, album_cache: PersistentCache = None):
+        r"""Creates a new ``AlbumFetcher`` object
+
+        :param YTMusic credentials: an authenticated ``YTMusic`` object
+        :param PersistentCache album_cache: a cache of albums retrieved in previous runs, defaults to None
+        """
+
+        self.credentials = credentials
+        self.album_cache = album_cache
+        self._futures: dict[str, Future[tuple[dict[str, Any], dict[str, dict[str, Any]]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, album_id: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+        """Gets a Youtube album and its tracks indexed by video id, waiting for it if another worker is already retrieving it
+
+        :param str album_id: an album id
+        :return tuple[dict[str, Any], dict[str, dict[str, Any]]]: the album dictionary and its track dictionaries keyed by video id
+        """
+
+        with self._lock:
+            future = self._futures.get(album_id)
+            owner = future is None
+            if owner:
+                future = self._futures[album_id] = Future()
+
+        if owner:
+            try:
+                future.set_result(get_yt_album(album_id, self.credentials, self.album_cache))
+            except Exception as e:
+                # a failed album isn't remembered, so later tracks of the album try again
+                with self._lock:
+                    del self._futures[album_id]
+                future.set_exception(e)
+
+        return future.result()
+
+
+@dataclass(slots=True)
+class Options:
+    r"""A class representing the options in the `playlist-master` table of a config, with defaults for any that are missing
+
+    :param str playlist_id: the ID of the playlist, defaults to None
+    :param str platform: the platform on which the playlist exists, defaults to None
+    :param str thumbnail_quality: the quality of the thumbnail to download from Youtube, defaults to 'default'
+    :param bool genlogs: whether to generate logs in a file or directly in the terminal, defaults to True
+    :param str logdir: the directory in which to place the log file, defaults to ``LOG_DEFAULT_DIR``
+    :param str cachedir: the directory in which to cache data between runs, defaults to ``CACHE_DEFAULT_DIR``
+    :param str loglevel: the level at which to log messages, defaults to 'info'
+    :param bool cookie_headers: whether to authenticate with exported cookie headers, defaults to False
+    :param bool sort: whether to sort the output files by artist and album, defaults to False
+    :param bool force: whether to download tracks that were downloaded in a previous run again, defaults to False
+    :param int concurrency: the number of tracks to download at the same time, defaults to ``CONCURRENCY_DEFAULT``
+    :param float rate_limit: the maximum number of tracks to start downloading per second, defaults to None (no limit)
+    :param float album_ttl: the number of hours after which a cached album is retrieved again, defaults to ``ALBUM_TTL_DEFAULT``
+    :param float search_ttl: the number of hours after which a cached search is made again, defaults to ``SEARCH_TTL_DEFAULT``
+    """
+
+    playlist_id: str | None = None
+    platform: str | None = None
+    thumbnail_quality: str = "default"
+    genlogs: bool = True
+    logdir: str = LOG_DEFAULT_DIR
+    cachedir: str = CACHE_DEFAULT_DIR
+    loglevel: str = "info"
+    cookie_headers: bool = False
+    sort: bool = False
+    force: bool = False
+    concurrency: int = CONCURRENCY_DEFAULT
+    rate_limit: float | None = None
+    album_ttl: float = ALBUM_TTL_DEFAULT
+    search_ttl: float = SEARCH_TTL_DEFAULT
+
+    def __post_init__(self):
+        # names are matched case-insensitively, as they are on the command line
+        if self.platform:
+            self.platform = self.platform.lower()
+        self.thumbnail_quality = self.thumbnail_quality.lower()
+        self.loglevel = self.loglevel.lower()
+
+    @classmethod
+    def from_table(cls, table: dict[str, Any]) -> "Options":
+        r"""Creates a new ``Options`` object from a parsed `playlist-master` table, ignoring any keys it doesn't know
+
+        :param dict[str, Any] table: the `playlist-master` table
+        :return Options: a new ``Options`` object
+        """
+
+        return cls(**{f.name: table[f.name] for f in fields(cls) if f.name in table})
+
+
+@dataclass(slots=True)
+class Track:
+    r"""A class representing a song/track
+
+    :param list[str] artists: the artists of the track
+    :param list[str] album_artists: the artists of the album the track belongs to
+    :param str title: the title of the track
+    :param str album_title: the title of the album the track belongs to
+    :param str release_date: the release date in the form 'yyyy-mm-dd'
+    :param str art_url: the url of the album's (or song's) cover art
+    :param int track_number: the track number in the album
+    :param int total_tracks: the total number of tracks in the album
+    :param int disc_number: the disc number the track belongs to
+    :param bool explicit: whether the track contains profanity or is considered 'explicit', defaults to False
+    :param str track_id: the ID of the track on the platform it was retrieved from, defaults to None
+    """
+
+    artists: list[str]
+    album_artists: list[str]
+    title: str | None
+    album_title: str | None
+    release_date: str | None
+    art_url: str | None
+    track_number: int | None
+    total_tracks: int | None
+    disc_number: int | None
+    explicit: bool = False
+    track_id: str | None = None
+
+    # joined once after creation rather than every time metadata is applied
+    artist_str: str = field(init=False, repr=False)
+    album_artist_str: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.artist_str = "; ".join(self.artists)
+        self.album_artist_str = "; ".join(self.album_artists)
+
+
 def get_spotify_track_info(track: dict[str, Any], logger: Logger = None) -> Track | None:
     r"""Creates a new ``Track`` object from a Spotify Web API request retrieving a track
 
@@ -128,17 +436,20 @@ def get_spotify_track_info(track: dict[str, Any], logger: Logger = None) -> Trac
 
     try:
         album = track["album"]
+        album_type = album["album_type"]
+        images = album["images"]
         return Track(
             [artist["name"] for artist in track["artists"]],
-            ["Various Artists"] if album["album_type"] == "compilation" else [artist["name"] for artist in album["artists"]],
+            ["Various Artists"] if album_type == "compilation" else [artist["name"] for artist in album["artists"]],
             track["name"],
-            None if album["album_type"] == "single" else album["name"],
+            None if album_type == "single" else album["name"],
             format_date(album["release_date"]),
-            album["images"][0]["url"] if album["images"] else None,
+            images[0]["url"] if images else None,
             track["track_number"],
             album["total_tracks"],
             track["disc_number"],
-            track["explicit"]
+            track["explicit"],
+            track["id"]
         )
     except Exception as e:
         if logger:
@@ -146,12 +457,13 @@ def get_spotify_track_info(track: dict[str, Any], logger: Logger = None) -> Trac
             logger.error("could not retrieve track info for track: %s", track)
         return None
     
-def get_youtube_track_info(track: dict[str, Any], thumbnail_quality: int, album: dict[str, Any], logger: Logger = None) -> Track | None:
+def get_youtube_track_info(track: dict[str, Any], thumbnail_quality: int, album: dict[str, Any], album_tracks: dict[str, dict[str, Any]], logger: Logger = None) -> Track | None:
     r"""Creates a new ``Track`` object from a Youtube Data API V3 request retrieving a track
 
     :param dict[str, Any] track: a Youtube track dictionary
     :param int thumbnail_quality: the desired thumbnail quality
     :param dict[str, Any] album: a Youtube album dictionary
+    :param dict[str, dict[str, Any]] album_tracks: the album's track dictionaries keyed by video id
     :param Logger logger: a logger, defaults to None
     :return Track | None: a new ``Track`` object
     """
@@ -161,9 +473,7 @@ def get_youtube_track_info(track: dict[str, Any], thumbnail_quality: int, album:
 
         # it's worth noting that sometimes the track's video id doesn't match the one in the retrieved album
         # it doesn't make much sense but that's how it is
-        track_misc_info = None if not album else list(filter(lambda t: t["videoId"] == track["videoId"], album["tracks"]))
-        if track_misc_info and len(track_misc_info) == 0:
-            track_misc_info = None
+        track_misc_info = None if not album else album_tracks.get(track["videoId"])
 
         # disc number is always `None` since the Youtube API doesn't have that information
         return Track(
@@ -176,7 +486,8 @@ def get_youtube_track_info(track: dict[str, Any], thumbnail_quality: int, album:
             None if not track_misc_info else track_misc_info["trackNumber"],
             None if not album else album["trackCount"],
             None,
-            track["isExplicit"]
+            track["isExplicit"],
+            track["videoId"]
         )
     except Exception as e:
         if logger:
@@ -184,13 +495,104 @@ def get_youtube_track_info(track: dict[str, Any], thumbnail_quality: int, album:
             logger.error("could not retrieve track info for track: %s", track)
         return None
 
-def format_date(date: str) -> str:
-    r"""Gets the year of a date in the format 'yyy-mm-dd'
+def format_date(date: str) -> str | None:
+    r"""Gets the year of a date in the format 'yyyy-mm-dd', 'yyyy-mm' or 'yyyy'
 
     :param str date: a date
-    :return str: the year of ``date``
+    :return str | None: the year of ``date``
     """
-    return None if date is None else date.split('-')[0]
+
+    # the year is always the first four characters, so slicing avoids building a list of the date's parts
+    return date[:4] if date else None
+
+
+def _load_toml_cached(path: str) -> dict[str, Any]:
+    r"""Loads a .toml file, only reparsing it if it has changed since it was last loaded
+
+    :param str path: the path to a .toml file
+    :return dict[str, Any]: a copy of the parsed file that is safe to mutate
+    """
+
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _TOML_CACHE.get(path)
+    if not cached or cached[0] != stamp:
+        with open(path, "rb") as config:
+            cached = (stamp, tomllib.load(config))
+        _TOML_CACHE[path] = cached
+
+    # `download_playlist` mutates the options it's given, so the cached copy must never be handed out
+    return copy.deepcopy(cached[1])
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ytdlp_options(options: str) -> dict[str, Any]:
+    r"""Parses a string of yt-dlp command line options, memoizing the result
+
+    :param str options: yt-dlp command line options
+    :return dict[str, Any]: the parsed yt-dlp options, which must not be modified
+    """
+
+    return yt.parse_options(shlex.split(options)).ydl_opts
+
+
+def _build_ytdlp_options(options: str, logger: Logger) -> dict[str, Any]:
+    r"""Creates the yt-dlp options used to download a playlist
+
+    :param str options: yt-dlp command line options
+    :param Logger logger: a logger for yt-dlp to log to
+    :return dict[str, Any]: a fresh copy of the parsed yt-dlp options
+    """
+
+    ytdlp_options = copy.deepcopy(_parse_ytdlp_options(options))
+    ytdlp_options["logger"] = YtDlpLogger(logger)
+    return ytdlp_options
+
+
+def _apply_ytdlp(opts: dict[str, Any], value: str, kwargs: dict[str, Any]):
+    r"""Applies the ``yt_dlp`` command line argument to the options
+
+    :param dict[str, Any] opts: the options parsed from the config
+    :param str value: a string of yt-dlp command line options
+    :param dict[str, Any] kwargs: all command line arguments
+    """
+
+    opts["yt-dlp"]["options"] = value
+
+
+def _apply_yt_oauth(opts: dict[str, Any], value: str | dict[str, str], kwargs: dict[str, Any]):
+    r"""Applies the ``yt_oauth`` command line argument to the options
+
+    :param dict[str, Any] opts: the options parsed from the config
+    :param str | dict[str, str] value: a cookie headers file path, or a client id and secret
+    :param dict[str, Any] kwargs: all command line arguments
+    """
+
+    if kwargs["cookie_headers"]:
+        opts["yt-oauth"] = value
+    else:
+        opts["yt-oauth"] = ytm.setup_oauth(value["client_id"], value["client_secret"])
+
+
+def _apply_sp_oauth(opts: dict[str, Any], value: dict[str, str], kwargs: dict[str, Any]):
+    r"""Applies the ``sp_oauth`` command line argument to the options
+
+    :param dict[str, Any] opts: the options parsed from the config
+    :param dict[str, str] value: a client id and secret
+    :param dict[str, Any] kwargs: all command line arguments
+    """
+
+    opts["sp-oauth"] = value
+
+
+# command line arguments that don't belong in the `playlist-master` table, and how to apply them
+_CLI_OPTION_HANDLERS = {
+    "yt_dlp": _apply_ytdlp,
+    "yt_oauth": _apply_yt_oauth,
+    "sp_oauth": _apply_sp_oauth
+}
 
 
 def download_playlist(config_path: str, **kwargs: dict[str, Any]):
@@ -199,24 +601,21 @@ def download_playlist(config_path: str, **kwargs: dict[str, Any]):
     :param str config_path: the path to a config file
     """
 
-    opts: dict[str, str | int | bool | dict[str, Any]] = {}
+    opts: dict[str, Any] = {}
 
     # parse config file or create default dictionary if none was supplied
     if not config_path or not os.path.exists(config_path):
-        opts["playlist-master"] = None
-        opts["yt-dlp"] = None
-        opts["yt-oauth"] = None
-        opts["sp-oauth"] = None
+        opts = tomllib.loads(_DEFAULT_CONFIG_TOML)
     else:
-        with open(config_path, "rb") as config:
-            opts = tomllib.load(config)
+        opts = _load_toml_cached(config_path)
 
     # cache oauth information so it doesn't get lost
+    pm = opts["playlist-master"]
     temp_client = None
     temp_secret = None
     temp_cookie_headers = None
     if opts["yt-oauth"]:
-        if "cookie_headers" in opts["playlist-master"] and "cookie_headers_path" in opts["yt-oauth"]:
+        if pm.get("cookie_headers") and "cookie_headers_path" in opts["yt-oauth"]:
             temp_cookie_headers = opts["yt-oauth"]["cookie_headers_path"]
         elif "client_id" in opts["yt-oauth"] and "client_secret" in opts["yt-oauth"]:
             temp_client = opts["yt-oauth"]["client_id"]
@@ -229,190 +628,349 @@ def download_playlist(config_path: str, **kwargs: dict[str, Any]):
         if not value:
             continue
 
-        if key == "yt_dlp":
-            opts["yt-dlp"]["options"] = value
-        elif key == "yt_oauth":
-            credentials = None
-            if kwargs["cookie_headers"]:
-                credentials = value
-            else:
-                credentials = ytm.setup_oauth(value["client_id"], value["client_secret"])
-            opts["yt-oauth"] = credentials
-        elif key == ["sp_oauth"]:
-            opts["sp-oauth"] = value
+        if key in _CLI_OPTION_HANDLERS:
+            _CLI_OPTION_HANDLERS[key](opts, value, kwargs)
         else:
-            opts["playlist-master"][key] = value
-    
+            pm[key] = value
+
+    # the merged table is only read from now on, so its defaults are filled in once
+    options = opts["playlist-master"] = Options.from_table(pm)
+
     # initialize logger
-    logdir = LOG_DEFAULT_DIR
-    if "logdir" in opts["playlist-master"]:
-        logdir = opts["playlist-master"]["logdir"]
-
-    loglevel = logging.INFO
-    if "loglevel" in opts["playlist-master"]:
-        loglevel = opts["playlist-master"]["loglevel"]
-
-    logger = logging.getLogger(__name__)
-    date = dt.datetime.now().date().strftime(r"%Y-%m-%d")
-    time = dt.datetime.now().time().strftime(r"%H-%M-%S")
-    filename = os.path.join(logdir, f"{date}_{time}_playlist-master.log")
-    logging.basicConfig(filename=(filename if opts["playlist-master"]["genlogs"] else None), encoding="utf-8", filemode='w', format="%(asctime)s %(levelname)s: %(message)s", datefmt="%Y-%m-%d %H:%M:%S (%Z)", level=loglevel)
-
-    # restore cached oauth information if none were supplied in the command line arguments,
-    # or stop execution if no oauth information were supplied at all
-    if not opts["yt-oauth"]:
-        if temp_client and temp_secret:
-            opts["yt-oauth"] = ytm.setup_oauth(temp_client, temp_secret, open_browser=True)
-        elif temp_cookie_headers:
-            opts["yt-oauth"] = temp_cookie_headers
+    # the date and time are taken from a single timestamp so they can't straddle midnight
+    logger = _LOGGER
+    now = dt.datetime.now()
+    filename = os.path.join(options.logdir, now.strftime(r"%Y-%m-%d_%H-%M-%S") + "_playlist-master.log")
+
+    # the log levels in the config are lowercase, but `logging` only accepts uppercase level names
+    listener = _start_logging(logger, filename if options.genlogs else None, options.loglevel.upper())
+
+    try:
+        # restore cached oauth information if none were supplied in the command line arguments,
+        # or stop execution if no oauth information were supplied at all
+        if not opts["yt-oauth"]:
+            if temp_client and temp_secret:
+                opts["yt-oauth"] = ytm.setup_oauth(temp_client, temp_secret, open_browser=True)
+            elif temp_cookie_headers:
+                opts["yt-oauth"] = temp_cookie_headers
+            else:
+                logger.error("no youtube authentication credentials provided")
+                return
+
+        # download from the respective platform
+        if options.platform == "spotify":
+            download_spotify_playlist(options.playlist_id, opts, logger)
+        elif options.platform == "youtube":
+            download_youtube_playlist(options.playlist_id, opts, logger)
         else:
-            logger.error("no youtube authentication credentials provided")
-            return
-    
-    # download from the respective platform
-    platform = opts["playlist-master"]["platform"].lower()
-    if platform == "spotify":
-        download_spotify_playlist(opts["playlist-master"]["playlist_id"], opts, logger)
-    elif platform == "youtube":
-        download_youtube_playlist(opts["playlist-master"]["playlist_id"], opts, logger)
+            logger.error("unsupported platform: %s", options.platform)
+    finally:
+        _stop_logging(logger, listener)
+
 
+def _start_logging(logger: Logger, filename: str | None, loglevel: str) -> QueueListener:
+    r"""Attaches a handler for this run to ``logger``
 
-def download_spotify_playlist(playlist_id: str, config: dict[str, str | int | bool | dict[str, Any]], logger: Logger):
+    Worker threads only put records on a queue, while a single background thread formats them and writes them out.
+
+    :param Logger logger: the logger to attach the handler to
+    :param str | None filename: the file to write logs to, or None to write them to the terminal
+    :param str loglevel: the name of the level at which to log messages
+    :return QueueListener: the started listener writing out the queued records
+    """
+
+    if filename:
+        os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+        handler = logging.FileHandler(filename, mode='w', encoding="utf-8")
+    else:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT, LOG_DATEFMT))
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    # NOTSET on a non-root logger would defer to the root logger's WARNING level instead of logging everything
+    logger.setLevel(logging.DEBUG if loglevel == "NOTSET" else loglevel)
+
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
+def _stop_logging(logger: Logger, listener: QueueListener):
+    r"""Flushes the remaining records of this run and detaches its handlers from ``logger``
+
+    :param Logger logger: the logger the handler was attached to
+    :param QueueListener listener: the listener returned by ``_start_logging()``
+    """
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    for handler in [h for h in logger.handlers if isinstance(h, QueueHandler) and h.queue is listener.queue]:
+        logger.removeHandler(handler)
+
+
+def download_spotify_playlist(playlist_id: str, config: dict[str, Any], logger: Logger):
     """Downloads a playlist from Spotify
 
     :param str playlistID: a playlist id
-    :param dict[str, str  |  int  |  bool  |  dict[str, Any]] config: a dictionary containing options and oauth info
+    :param dict[str, Any] config: a dictionary containing the playlist-master ``Options``, yt-dlp options and oauth info
     :param Logger logger: a logger
     """
 
     # initialize credentials and yt-dlp options for downloading
-    ytauth = YTMusic(config["yt-oauth"])
+    ytauth = _get_ytmusic_client(config["yt-oauth"])
     spauth = config["sp-oauth"]
-    ytdlp_options = yt.parse_options(shlex.split(config["yt-dlp"]["options"])).ydl_opts
-    ytdlp_options["logger"] = YtDlpLogger(logger)
+    ytdlp_options = _build_ytdlp_options(config["yt-dlp"]["options"], logger)
+
+    tracks = (get_spotify_track_info(item["track"], logger) for item in iter_spotify_tracks(playlist_id, spauth))
+
+    # the same song can be added to a playlist more than once, or be on it as both a single and an album track
+    # tracks missing an artist or title aren't compared, so they still fail on their own in the worker instead of here
+    tracks = _iter_unique(tracks, lambda track: None if not track or not track.artists or not track.title else (track.artists[0].casefold(), track.title.casefold()), logger)
+
+    # different songs can still resolve to the same Youtube track when searched for
+    resolved = SeenSet()
+
+    # tracks don't depend on each other, so searching, downloading and tagging is overlapped across tracks
+    options: Options = config["playlist-master"]
+    sort = options.sort and bool(ytdlp_options["outtmpl"])
+    search_cache = PersistentCache(os.path.join(options.cachedir, "searches.json"), ttl=options.search_ttl * 3600, logger=logger)
+    downloads = DownloadCache(os.path.join(options.cachedir, "downloads.db"), "spotify", playlist_id)
+    with search_cache, downloads, ArtworkPrefetcher(cachedir=os.path.join(options.cachedir, "artwork")) as prefetcher, YtDlpPool(ytdlp_options, options.rate_limit) as pool, ThreadPoolExecutor(max_workers=options.concurrency) as executor:
+        list(executor.map(lambda track: _process_spotify_track(track, ytauth, pool, prefetcher, downloads, search_cache, resolved, sort, options.force, logger), tracks))
+
+
+def _process_spotify_track(track: Track | None, ytauth: YTMusic, pool: YtDlpPool, prefetcher: ArtworkPrefetcher, downloads: DownloadCache, search_cache: PersistentCache, resolved: SeenSet, sort: bool, force: bool, logger: Logger):
+    r"""Searches for a Spotify track on Youtube, downloads it and applies its metadata
+
+    :param Track | None track: a ``Track`` object
+    :param YTMusic ytauth: an authenticated ``YTMusic`` object
+    :param YtDlpPool pool: the pool to borrow a downloader from
+    :param ArtworkPrefetcher prefetcher: the prefetcher to download cover art with
+    :param DownloadCache downloads: the record of tracks downloaded in previous runs
+    :param PersistentCache search_cache: a cache of searches made in previous runs
+    :param SeenSet resolved: the urls already resolved for other tracks of the playlist during this run
+    :param bool sort: whether to sort the output file by artist and album
+    :param bool force: whether to download the track even if it was downloaded in a previous run
+    :param Logger logger: a logger
+    """
 
-    # cache for keeping track of downloaded files to apply metadata afterwards
-    outputs = []
-    
-    tracks = list(map(lambda track: get_spotify_track_info(track["track"]), get_spotify_tracks(playlist_id, spauth)))
-    for track in tracks:
-        if not track:
-            logger.error("unable to retrieve track")
-            continue
-            
-        # search for the track on Youtube by artist and track name
-        try:
-            logger.info(f"searching for: {track.artists[0] if track.artists[0] else "NoneType"} {track.title if track.title else "NoneType"}")
-            url = search_yt(track.title, track.artists[0], ytauth, track.explicit)
-
-            if url is None:
-                logger.info(f"no results for: {track.artists[0] if track.artists[0] else "NoneType"} {track.title if track.title else "NoneType"}")
-                continue
-        except Exception as e:
-            logger.error("exception occurred while retrieving url for %s", track)
-            logger.error(e, stack_info=True, exc_info=True)
-            continue
-        
-        # if sorting is enabled, the output directory specified in the yt-dlp options needs to be modified
-        if config["playlist-master"]["sort"] and ytdlp_options["outtmpl"]:
-            out = ytdlp_options["outtmpl"]["default"]
-            i = 0
-            if '/' in out:
-                i = out.rindex('/') + 1
-            elif '\\' in out:
-                i = out.rindex('\\') + 1
+    if not track:
+        logger.error("unable to retrieve track")
+        return
 
-            out = out[:i] + f"{track.artists[0]}/{track.album_title if track.album_title else "Singles"}/" + out[i:]
-            ytdlp_options["outtmpl"]["default"] = out
+    if not force and track.track_id and downloads.is_downloaded(track.track_id):
+        logger.info("already downloaded: %s %s", track.artists[0], track.title)
+        return
 
-        logger.info("downloading from url: %s", url)
-        download(url, ytdlp_options, outputs)
-        
-        if not outputs[-1]:
-            logger.warning("unable to apply metadata")
-            continue
+    # search for the track on Youtube by artist and track name
+    try:
+        logger.info("searching for: %s %s", track.artists[0], track.title)
+        url = search_yt(track.artists[0], track.title, ytauth, track.explicit, search_cache)
 
-        # apply metadata
-        m = music_tag.load_file(outputs[-1])
-        r = apply_metadata(m, track, logger)
-        if r:
-            logger.info("applied metadata")
-        else:
-            logger.warning("unable to apply metadata")
+        if url is None:
+            logger.info("no results for: %s %s", track.artists[0], track.title)
+            return
+    except Exception as e:
+        logger.error("exception occurred while retrieving url for %s", track)
+        logger.error(e, stack_info=True, exc_info=True)
+        return
+
+    if not resolved.add(url):
+        logger.info("duplicate of another track in the playlist: %s %s", track.artists[0], track.title)
+        return
 
+    _download_track(url, track, pool, prefetcher, downloads, sort, logger)
 
-def download_youtube_playlist(playlist_id: str, config: dict[str, str | int | bool | dict[str, Any]], logger: Logger):
+
+def download_youtube_playlist(playlist_id: str, config: dict[str, Any], logger: Logger):
     """Downloads a playlist from Youtube
 
     :param str playlistID: a playlist id
-    :param dict[str, str  |  int  |  bool  |  dict[str, Any]] config: a dictionary containing options and oauth info
+    :param dict[str, Any] config: a dictionary containing the playlist-master ``Options``, yt-dlp options and oauth info
     :param Logger logger: a logger
     """
 
     # initialize credentials and yt-dlp options for downloading
-    ytauth = YTMusic(config["yt-oauth"])
-    ytdlp_options = yt.parse_options(shlex.split(config["yt-dlp"]["options"])).ydl_opts
-    ytdlp_options["logger"] = YtDlpLogger(logger)
+    ytauth = _get_ytmusic_client(config["yt-oauth"])
+    ytdlp_options = _build_ytdlp_options(config["yt-dlp"]["options"], logger)
 
-    # cache for keeping track of downloaded files to apply metadata afterwards
-    outputs = []
+    # the same video can be added to a playlist more than once
+    tracks = _iter_unique(get_yt_tracks(playlist_id, ytauth), lambda track: track["videoId"], logger)
+
+    # tracks don't depend on each other, so downloading and tagging is overlapped across tracks
+    options: Options = config["playlist-master"]
+    sort = options.sort and bool(ytdlp_options["outtmpl"])
+    thumbnail_quality = ThumbnailQuality[options.thumbnail_quality.upper()].value
+    album_cache = PersistentCache(os.path.join(options.cachedir, "albums.json"), ttl=options.album_ttl * 3600, logger=logger)
+    downloads = DownloadCache(os.path.join(options.cachedir, "downloads.db"), "youtube", playlist_id)
+    albums = AlbumFetcher(ytauth, album_cache)
+    with album_cache, downloads, ArtworkPrefetcher(cachedir=os.path.join(options.cachedir, "artwork")) as prefetcher, YtDlpPool(ytdlp_options, options.rate_limit) as pool, ThreadPoolExecutor(max_workers=options.concurrency) as executor:
+        list(executor.map(lambda track: _process_youtube_track(track, albums, pool, prefetcher, downloads, thumbnail_quality, sort, options.force, logger), tracks))
+
+
+def _process_youtube_track(track: dict[str, Any], albums: AlbumFetcher, pool: YtDlpPool, prefetcher: ArtworkPrefetcher, downloads: DownloadCache, thumbnail_quality: int, sort: bool, force: bool, logger: Logger):
+    r"""Downloads a Youtube track and applies its metadata
+
+    :param dict[str, Any] track: a Youtube track dictionary
+    :param AlbumFetcher albums: the fetcher to get the track's album from
+    :param YtDlpPool pool: the pool to borrow a downloader from
+    :param ArtworkPrefetcher prefetcher: the prefetcher to download cover art with
+    :param DownloadCache downloads: the record of tracks downloaded in previous runs
+    :param int thumbnail_quality: the desired thumbnail quality
+    :param bool sort: whether to sort the output file by artist and album
+    :param bool force: whether to download the track even if it was downloaded in a previous run
+    :param Logger logger: a logger
+    """
+
+    if not force and downloads.is_downloaded(track["videoId"]):
+        logger.info("already downloaded: %s", track["title"])
+        return
+
+    # if playlistID is a valid playlist id, then no track should be `None` (i.e. all returned tracks will have a url)
+    album, album_tracks = albums.get(track["album"]["id"]) if track["album"] else (None, None)
+    track_info = get_youtube_track_info(track, thumbnail_quality, album, album_tracks, logger)
+    if not track_info:
+        logger.error("unable to retrieve track")
+        return
+
+    _download_track(_YT_WATCH_URL + track["videoId"], track_info, pool, prefetcher, downloads, sort, logger)
+
+
+def _iter_unique(tracks: Iterable[Any], key: Callable[[Any], Any], logger: Logger) -> Iterator[Any]:
+    r"""Iterates over the tracks of a playlist, skipping any that are duplicates of an earlier one
+
+    :param Iterable[Any] tracks: the tracks of a playlist
+    :param Callable[[Any], Any] key: gets the value by which a track is compared, or None if it can't be compared
+    :param Logger logger: a logger
+    :yield Any: the tracks that aren't duplicates
+    """
 
-    tracks = get_yt_tracks(playlist_id, ytauth)
+    seen = SeenSet()
     for track in tracks:
-        # if playlistID is a valid playlist id, then no track should be `None` (i.e. all returned tracks will have a url)
-        track_info = get_youtube_track_info(track, ThumbnailQuality[config["playlist-master"]["thumbnail_quality"].upper()].value if "thumbnail_quality" in config["playlist-master"] else 0, ytauth.get_album(track["album"]["id"]) if track["album"] else None, logger)
-        url = f"https://music.youtube.com/watch?v={track["videoId"]}"
-        logger.info("downloading from url: %s", url)
+        k = key(track)
+        if k is not None and not seen.add(k):
+            logger.info("skipping duplicate track: %s", k)
+            continue
+
+        yield track
+
+
+def _download_track(url: str, track: Track, pool: YtDlpPool, prefetcher: ArtworkPrefetcher, downloads: DownloadCache, sort: bool, logger: Logger):
+    r"""Downloads a track from Youtube at ``url`` and applies its metadata
+
+    :param str url: the url of the track
+    :param Track track: the track's metadata
+    :param YtDlpPool pool: the pool to borrow a downloader from
+    :param ArtworkPrefetcher prefetcher: the prefetcher to download cover art with
+    :param DownloadCache downloads: the record to add the track to once it's done
+    :param bool sort: whether to sort the output file by artist and album
+    :param Logger logger: a logger
+    """
 
+    # the cover art is downloaded while the track itself is
+    artwork = prefetcher.prefetch(track.art_url) if track.art_url else None
+
+    with pool.acquire() as downloader:
         # if sorting is enabled, the output directory specified in the yt-dlp options needs to be modified
-        if config["playlist-master"]["sort"] and ytdlp_options["outtmpl"]:
-            out = ytdlp_options["outtmpl"]["default"]
-            i = 0
-            if '/' in out:
-                i = out.rindex('/') + 1
-            elif '\\' in out:
-                i = out.rindex('\\') + 1
-
-            out = out[:i] + f"{track_info.artists[0]}/{track_info.album_title if track_info.album_title else "Singles"}/" + out[i:]
-            ytdlp_options["outtmpl"]["default"] = out
-
-        download(url, ytdlp_options, outputs)
-        if not outputs[-1]:
-            logger.warning("unable to apply metadata")
-            continue
-        
-        # apply metadata
-        m = music_tag.load_file(outputs[-1])
-        r = apply_metadata(m, track_info, logger)
-        if r:
-            logger.info("applied metadata")
-        else:
-            logger.warning("unable to apply metadata")
+        outtmpl = None
+        if sort:
+            outtmpl = os.path.join(downloader.outtmpl_dir, _get_sort_dir(track.artists[0], track.album_title or "Singles"), downloader.outtmpl_name)
+
+        logger.info("downloading from url: %s", url)
+        path = downloader.download(url, outtmpl)
+
+    if not path:
+        logger.warning("unable to apply metadata")
+        return
+
+    # apply metadata
+    m = music_tag.load_file(path)
+    r = apply_metadata(m, track, logger, artwork)
+    if r:
+        logger.info("applied metadata")
+        # failing to record the track only means it's downloaded again next run, so it doesn't fail the track
+        if track.track_id:
+            try:
+                downloads.add(track.track_id, path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("unable to record downloaded track: %s", e)
+    else:
+        logger.warning("unable to apply metadata")
 
 
-def get_spotify_tracks(playlist_id: str, credentials: dict[str, str]) -> dict[str, Any]:
-    """Gets the individual tracks from a Spotify playlist
+@functools.lru_cache(maxsize=1024)
+def _get_sort_dir(artist: str, album_title: str) -> str:
+    r"""Gets the directory, relative to the output directory, in which a track is placed when sorting
+
+    Results are memoized since many tracks share an artist and album.
+
+    :param str artist: the name of the track's artist
+    :param str album_title: the title of the track's album
+    :return str: the directory, safe to use in a yt-dlp output template
+    """
+
+    return os.path.join(artist.translate(_PATH_TRANSLATION).strip(), album_title.translate(_PATH_TRANSLATION).strip())
+
+
+def _get_ytmusic_client(credentials: str | dict[str, Any]) -> YTMusic:
+    r"""Creates a client for requesting from Youtube Music, reusing it for the same credentials
+
+    :param str | dict[str, Any] credentials: the path to a cookie headers .json file or an OAuth token
+    :return YTMusic: an authenticated ``YTMusic`` object
+    """
+
+    # OAuth tokens are dictionaries, which can't be used as keys themselves
+    key = credentials if isinstance(credentials, str) else json.dumps(credentials, sort_keys=True, default=str)
+    client = _YTMUSIC_CLIENTS.get(key)
+    if not client:
+        client = _YTMUSIC_CLIENTS[key] = YTMusic(credentials)
+
+    return client
+
+
+@functools.lru_cache(maxsize=8)
+def _get_spotify_client(client_id: str, client_secret: str) -> sp.Spotify:
+    r"""Creates a client for requesting from the Spotify Web API, reusing it (and its access token) for the same credentials
+
+    :param str client_id: the OAuth 2.0 client id
+    :param str client_secret: the OAuth 2.0 client secret
+    :return sp.Spotify: a Spotify Web API client
+    """
+
+    # a plain session without spotipy's retry adapter, since every request is already retried by `with_backoff`
+    # with the retry adapter, even a zero-retry one, a 429 or 5xx would surface as a generic 429 without the response's headers,
+    # so its `Retry-After` could never be waited out
+    client_credentials_manager = SpotifyClientCredentials(client_id, client_secret)
+    return sp.Spotify(client_credentials_manager=client_credentials_manager, requests_session=requests.Session())
+
+
+def iter_spotify_tracks(playlist_id: str, credentials: dict[str, str]) -> Iterator[dict[str, Any]]:
+    """Iterates over the individual tracks from a Spotify playlist, yielding each page's tracks as soon as it arrives
 
     :param str playlistID: a playlist id
     :param dict[str, str] credentials: a dictionary containing oauth info
-    :return dict[str, Any]: a list containing all track dictionaries as they are in a Spotify Web API response
+    :yield dict[str, Any]: track dictionaries as they are in a Spotify Web API response
     """
 
-    # initialize credentials for requesting from Spotify Web API
-    client_credentials_manager = SpotifyClientCredentials(credentials["client_id"], credentials["client_secret"])
-    spotify = sp.Spotify(client_credentials_manager=client_credentials_manager)
-    results = spotify.playlist_items(playlist_id=playlist_id, limit=None)
+    spotify = _get_spotify_client(credentials["client_id"], credentials["client_secret"])
+    playlist_items = with_backoff(spotify.playlist_items)
+    results = playlist_items(playlist_id=playlist_id, fields=_SPOTIFY_PLAYLIST_FIELDS, limit=_SPOTIFY_PAGE_LIMIT)
 
     if not results:
-        return []
+        return
 
-    # in case the response is limited, all tracks will be retrieved
-    tracks = results["items"]
-    while results["next"]:
-        results = spotify.next(results)
-        tracks.extend(results["items"])
+    # the first page's tracks can start downloading while the remaining pages are requested
+    yield from results["items"]
 
-    return tracks
+    # the first page reveals the size of the playlist, so the remaining pages are all requested at once
+    # `executor.map` yields them in offset order
+    offsets = range(_SPOTIFY_PAGE_LIMIT, results["total"], _SPOTIFY_PAGE_LIMIT)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        for page in executor.map(lambda offset: playlist_items(playlist_id=playlist_id, fields=_SPOTIFY_PLAYLIST_FIELDS, limit=_SPOTIFY_PAGE_LIMIT, offset=offset), offsets):
+            yield from page["items"]
 
 
 def get_yt_tracks(playlist_id: str, credentials: YTMusic) -> list[dict[str, Any]]:
@@ -423,57 +981,157 @@ def get_yt_tracks(playlist_id: str, credentials: YTMusic) -> list[dict[str, Any]
     :return list[dict[str, Any]]: a list of track dictionaries as they are in a Youtube Data API V3 response
     """
 
-    return credentials.get_playlist(playlist_id, limit=None)["tracks"]
+    return with_backoff(credentials.get_playlist)(playlist_id, limit=None)["tracks"]
+
+
+def get_yt_album(album_id: str, credentials: YTMusic, album_cache: PersistentCache = None) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    r"""Gets a Youtube album and indexes its tracks by video id
+
+    ``AlbumFetcher`` makes sure this is only called once per album during a run.
+
+    :param str album_id: an album id
+    :param YTMusic credentials: an authenticated ``YTMusic`` object
+    :param PersistentCache album_cache: a cache of albums retrieved in previous runs, defaults to None
+    :return tuple[dict[str, Any], dict[str, dict[str, Any]]]: the album dictionary as it is in a Youtube Data API V3 response and its track dictionaries keyed by video id
+    """
+
+    album = album_cache.get(album_id) if album_cache else None
+    if not album:
+        album = with_backoff(credentials.get_album)(album_id)
+        if album_cache:
+            album_cache.set(album_id, album)
+
+    return album, {t["videoId"]: t for t in album["tracks"]}
 
 
-def search_yt(artist: str, track_name: str, credentials: YTMusic, explicit: bool = False) -> str | None:
+def search_yt(artist: str, track_name: str, credentials: YTMusic, explicit: bool = False, search_cache: PersistentCache = None) -> str | None:
     r"""Searches for a track given the artist and the track name
 
+    Results are kept in ``search_cache``, so tracks repeated within a run or across runs don't search Youtube again.
+
     :param str artist: the name of the artist of the track
-    :param str song_name: the name of the track
+    :param str track_name: the name of the track
     :param YTMusic credentials: an authenticated ``YTMusic`` object
     :param bool explicit: whether the track contains profanity or is considered 'explicit', defaults to False
+    :param PersistentCache search_cache: a cache of searches made in previous runs, defaults to None
     :return str | None: the url of the track
     """
 
-    search = f"{artist} {track_name} explicit" if explicit else f"{artist} {track_name}"
-    song = credentials.search(search, filter='songs', limit=1)
-    if song.count == 0:
-        return None
+    # searches differing only in case or surrounding whitespace are the same search
+    key = f"{artist.strip().casefold()}\t{track_name.strip().casefold()}\t{int(explicit)}"
+    video_id = search_cache.get(key) if search_cache else None
 
-    return f"https://music.youtube.com/watch?v={song[0]['videoId']}"
+    # an empty video id records a search that had no results
+    if video_id is None:
+        search = f"{artist} {track_name} explicit" if explicit else f"{artist} {track_name}"
+        _SEARCH_BUCKET.acquire()
+        song = with_backoff(credentials.search)(search, filter='songs', limit=1)
+        video_id = song[0]["videoId"] if song else ""
+        if search_cache:
+            search_cache.set(key, video_id)
 
+    return _YT_WATCH_URL + video_id if video_id else None
 
-def download(url: str, options: dict[str, Any], output: list[str]):
-    r"""Downloads a track from Youtube at ``url``
 
-    :param str url: the url of the track
-    :param dict[str, Any] options: yt-dlp options
-    :param list[str] output: a list to append the downloaded file's path to
+@functools.lru_cache(maxsize=32)
+def fetch_artwork(url: str, cachedir: str = None) -> bytes:
+    r"""Downloads cover art, or reads it from ``cachedir`` if it was downloaded in a previous run
+
+    Results are memoized since tracks from the same album share their cover art.
+
+    :param str url: the url of the cover art
+    :param str cachedir: the directory in which to cache cover art between runs, defaults to None
+    :return bytes: the cover art
     """
 
-    with yt.YoutubeDL(options) as ytdl:
-        ytdl.add_post_hook(lambda p: output.append(p))
-        ytdl.download(url)
+    path = os.path.join(cachedir, hashlib.sha1(url.encode()).hexdigest()) if cachedir else None
+    artwork, etag = _read_cached_artwork(path) if path else (None, None)
+
+    # cover art urls are content-addressed, so cover art cached without an ETag is reused as is
+    if artwork is not None and not etag:
+        return artwork
+
+    headers = {"If-None-Match": etag} if etag else None
+    response = _ART_SESSION.get(url, headers=headers, timeout=10)
+    if artwork is not None and response.status_code == 304:
+        return artwork
+
+    response.raise_for_status()
+    artwork = response.content
+
+    if path:
+        # the cover art was downloaded successfully, so failing to cache it isn't an error
+        try:
+            _write_cached_artwork(path, artwork, response.headers.get("ETag"))
+        except OSError:
+            pass
+
+    return artwork
+
+
+def _read_cached_artwork(path: str) -> tuple[bytes | None, str | None]:
+    r"""Reads cover art cached in a previous run along with the ETag it was served with
+
+    :param str path: the path of the cached cover art
+    :return tuple[bytes | None, str | None]: the cover art, or None if it isn't cached, and its ETag, or None if there was none
+    """
+
+    try:
+        with open(path, "rb") as f:
+            artwork = f.read()
+    except OSError:
+        return None, None
+
+    try:
+        with open(f"{path}.etag", "r", encoding="utf-8") as f:
+            return artwork, f.read()
+    except OSError:
+        return artwork, None
+
+
+def _write_cached_artwork(path: str, artwork: bytes, etag: str | None):
+    r"""Caches cover art along with the ETag it was served with
+
+    :param str path: the path at which to cache the cover art
+    :param bytes artwork: the cover art
+    :param str | None etag: the cover art's ETag, or None if there was none
+    """
+
+    # written to a temporary file first so an interrupted write never leaves partial cover art behind
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as f:
+        f.write(artwork)
+    os.replace(temp, path)
+
+    # the ETag is only updated once the cover art it belongs to is in place,
+    # so stale cover art can never be paired with a newer ETag and revalidated forever
+    if etag:
+        with open(f"{path}.etag", "w", encoding="utf-8") as f:
+            f.write(etag)
+    elif os.path.exists(f"{path}.etag"):
+        os.remove(f"{path}.etag")
 
 
-def apply_metadata(file: Any, metadata: Track, logger: Logger) -> bool:
+def apply_metadata(file: Any, metadata: Track, logger: Logger, artwork: Future[bytes] = None) -> bool:
     """Applies metadata to an audio file
 
     :param Any file: an object returned from ``music_tag.load_file()``
     :param Track metadata: a ``Track`` object
     :param Logger logger: a logger
+    :param Future[bytes] artwork: the track's prefetched cover art, defaults to None
     :return bool: whether the metadata was successfully applied or not
     """
 
     try:
         file["tracktitle"] = metadata.title
-        file["artist"] = "; ".join(metadata.artists)
-        file["albumartist"] = "; ".join(metadata.album_artists)
+        file["artist"] = metadata.artist_str
+        file["albumartist"] = metadata.album_artist_str
         if metadata.album_title:
             file["album"] = metadata.album_title
         file["year"] = metadata.release_date
-        file["artwork"] = urlopen(metadata.art_url).read()
+        if metadata.art_url:
+            file["artwork"] = artwork.result() if artwork else fetch_artwork(metadata.art_url)
         if metadata.disc_number:
             file["discnumber"] = metadata.disc_number
         if metadata.track_number:
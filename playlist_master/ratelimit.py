@@ -0,0 +1,124 @@
+# python standard library dependencies
+import re
+import time
+import random
+import functools
+import threading
+from typing import Any, Callable
+
+
+# the HTTP status codes of responses that are worth retrying since the server may succeed later
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# matches the status code ytmusicapi mentions in the message of the exception it raises
+_HTTP_STATUS_PATTERN = re.compile(r"HTTP (\d{3})")
+
+
+def get_http_status(e: Exception) -> int | None:
+    """Gets the HTTP status code of the response that caused an exception
+
+    :param Exception e: an exception raised by spotipy or ytmusicapi
+    :return int | None: the status code, or None if the exception wasn't caused by an HTTP response
+    """
+
+    # spotipy exposes the status code, while ytmusicapi only mentions it in the message
+    status = getattr(e, "http_status", None)
+    if isinstance(status, int):
+        return status
+
+    match = _HTTP_STATUS_PATTERN.search(str(e))
+    return int(match.group(1)) if match else None
+
+
+def is_retryable(e: Exception) -> bool:
+    """Checks whether an exception was caused by a rate limit or a transient server error
+
+    :param Exception e: an exception raised by spotipy or ytmusicapi
+    :return bool: whether the request should be retried
+    """
+
+    return get_http_status(e) in RETRY_STATUSES
+
+
+def get_retry_after(e: Exception) -> float | None:
+    """Gets the number of seconds a server asked to wait before retrying through the `Retry-After` header
+
+    :param Exception e: an exception raised by spotipy or ytmusicapi
+    :return float | None: the number of seconds to wait, or None if the server didn't say
+    """
+
+    try:
+        return float(getattr(e, "headers", None)["Retry-After"])
+    except (TypeError, KeyError, ValueError):
+        return None
+
+
+def with_backoff(fn: Callable[..., Any], max_retries: int = 6, base: float = 0.5, cap: float = 60.0) -> Callable[..., Any]:
+    r"""Wraps a function that makes an API request so that it's retried with exponential backoff when rate limited or the server errors
+
+    When the exception carries the response's headers and they include `Retry-After`, that many seconds are waited out instead.
+    spotipy's exceptions carry the headers, while ytmusicapi's don't, so its requests always back off exponentially.
+
+    :param Callable[..., Any] fn: the function to wrap
+    :param int max_retries: the maximum number of times to retry, defaults to 6
+    :param float base: the number of seconds to wait before the first retry, defaults to 0.5
+    :param float cap: the maximum number of seconds to wait between retries, defaults to 60.0
+    :return Callable[..., Any]: the wrapped function
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        attempt = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= max_retries or not is_retryable(e):
+                    raise
+
+                delay = get_retry_after(e)
+                if delay is None:
+                    delay = min(cap, base * 2 ** attempt) + random.uniform(0, 0.25)
+
+                time.sleep(delay)
+                attempt += 1
+
+    return wrapper
+
+
+class TokenBucket:
+    """A thread-safe token bucket limiting how often something can happen
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        r"""Creates a new ``TokenBucket`` object
+
+        :param float rate: the number of tokens that are refilled every ``per`` seconds, which is also the bucket's capacity
+        :param float per: the number of seconds over which ``rate`` tokens are refilled, defaults to 1.0
+        """
+
+        self.rate = rate
+        self.per = per
+
+        # the bucket must be able to hold at least one token, or a rate below 1 could never be satisfied
+        self.capacity = max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes a token from the bucket, blocking until one is available
+        """
+
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                time.sleep((1 - self._tokens) * self.per / self.rate)
+
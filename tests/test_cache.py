@@ -0,0 +1,113 @@
+import json
+import os
+import time
+
+from cache import DownloadCache, PersistentCache
+
+
+def test_persistent_cache_round_trip(tmp_path):
+    path = tmp_path / "cache.json"
+
+    with PersistentCache(str(path)) as cache:
+        cache.set("album", {"title": "x"})
+        cache.set("search", "")
+
+    cache = PersistentCache(str(path))
+    assert cache.get("album") == {"title": "x"}
+    assert cache.get("search") == ""
+    assert cache.get("missing") is None
+
+
+def test_persistent_cache_expires_entries(tmp_path, monkeypatch):
+    path = tmp_path / "cache.json"
+    now = time.time()
+    path.write_text(json.dumps({"old": [now - 100, "a"], "new": [now - 10, "b"]}))
+
+    cache = PersistentCache(str(path), ttl=50)
+    assert cache.get("old") is None
+    assert cache.get("new") == "b"
+
+    # entries also expire while the cache is in use
+    monkeypatch.setattr(time, "time", lambda: now + 60)
+    assert cache.get("new") is None
+
+
+def test_persistent_cache_drops_malformed_entries(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps({"untimestamped": {"title": "x"}, "bad timestamp": ["x", "a"], "ok": [time.time(), "b"]}))
+
+    cache = PersistentCache(str(path), ttl=60)
+    assert cache.get("untimestamped") is None
+    assert cache.get("bad timestamp") is None
+    assert cache.get("ok") == "b"
+
+    # the dropped entries are removed from the file on the next save
+    assert cache.save()
+    assert set(json.loads(path.read_text())) == {"ok"}
+
+
+def test_persistent_cache_ignores_unusable_files(tmp_path):
+    for content in ("[1, 2, 3]", "not json", "null"):
+        path = tmp_path / "cache.json"
+        path.write_text(content)
+
+        cache = PersistentCache(str(path))
+        assert cache.get("anything") is None
+
+
+def test_persistent_cache_save_failure_is_not_raised(tmp_path):
+    # the cache's directory can't be created since a file is in the way
+    (tmp_path / "file").write_text("")
+    cache = PersistentCache(str(tmp_path / "file" / "cache.json"))
+    cache.set("key", "value")
+
+    assert not cache.save()
+
+
+def test_persistent_cache_leaves_no_temporary_files(tmp_path):
+    with PersistentCache(str(tmp_path / "cache.json")) as cache:
+        cache.set("key", "value")
+
+    assert os.listdir(tmp_path) == ["cache.json"]
+
+
+def test_download_cache_checks_mtime(tmp_path):
+    track = tmp_path / "track.mp3"
+    track.write_bytes(b"audio")
+
+    with DownloadCache(str(tmp_path / "downloads.db"), "spotify", "playlist") as downloads:
+        assert not downloads.is_downloaded("id")
+
+        downloads.add("id", str(track))
+        assert downloads.is_downloaded("id")
+
+        # other playlists don't share the record
+        with DownloadCache(str(tmp_path / "downloads.db"), "spotify", "other") as other:
+            assert not other.is_downloaded("id")
+
+        # a file changed since it was recorded has to be downloaded again
+        mtime = os.path.getmtime(track)
+        os.utime(track, (mtime + 10, mtime + 10))
+        assert not downloads.is_downloaded("id")
+
+        # as does a file that no longer exists
+        downloads.add("id", str(track))
+        track.unlink()
+        assert not downloads.is_downloaded("id")
+
+
+def test_download_cache_records_are_visible_to_other_runs(tmp_path):
+    track = tmp_path / "track.mp3"
+    track.write_bytes(b"audio")
+    path = str(tmp_path / "downloads.db")
+
+    first = DownloadCache(path, "youtube", "playlist")
+    second = DownloadCache(path, "youtube", "playlist")
+    first.add("id", str(track))
+
+    # the record is committed right away, so another run can both see it and record its own tracks
+    assert second.is_downloaded("id")
+    second.add("other", str(track))
+
+    first.close()
+    second.close()
@@ -0,0 +1,141 @@
+import io
+import json
+import time
+
+import pytest
+
+from ratelimit import TokenBucket, get_http_status, with_backoff
+
+
+class HTTPError(Exception):
+    """An exception shaped like spotipy's, carrying the status code and headers of the response
+    """
+
+    def __init__(self, http_status: int, headers: dict[str, str] = None):
+        super().__init__(f"HTTP {http_status}")
+        self.http_status = http_status
+        self.headers = headers
+
+
+def failing(*errors: Exception):
+    """Creates a function that raises ``errors`` one by one and then returns "ok", counting its calls
+    """
+
+    remaining = list(errors)
+
+    def fn():
+        fn.calls += 1
+        if remaining:
+            raise remaining.pop(0)
+        return "ok"
+
+    fn.calls = 0
+    return fn
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+    return slept
+
+
+def test_with_backoff_waits_out_retry_after(sleeps):
+    fn = failing(HTTPError(429, {"Retry-After": "7"}))
+
+    assert with_backoff(fn)() == "ok"
+    assert fn.calls == 2
+    assert sleeps == [7.0]
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+def test_with_backoff_retries_server_errors(sleeps, status):
+    fn = failing(HTTPError(status), HTTPError(status))
+
+    assert with_backoff(fn, base=0.5)() == "ok"
+    assert fn.calls == 3
+    assert len(sleeps) == 2
+    assert sleeps[0] < sleeps[1]
+
+
+def test_with_backoff_retries_ytmusicapi_errors(sleeps):
+    # ytmusicapi only mentions the status code in the message
+    fn = failing(Exception("Server returned HTTP 503: Service Unavailable"))
+
+    assert with_backoff(fn)() == "ok"
+    assert fn.calls == 2
+
+
+def test_with_backoff_does_not_retry_client_errors(sleeps):
+    fn = failing(HTTPError(404))
+
+    with pytest.raises(HTTPError):
+        with_backoff(fn)()
+    assert fn.calls == 1
+    assert sleeps == []
+
+
+def test_with_backoff_gives_up_after_max_retries(sleeps):
+    fn = failing(*(HTTPError(503) for _ in range(4)))
+
+    with pytest.raises(HTTPError):
+        with_backoff(fn, max_retries=2)()
+    assert fn.calls == 3
+
+
+def test_get_http_status():
+    assert get_http_status(HTTPError(429)) == 429
+    assert get_http_status(Exception("Server returned HTTP 502: Bad Gateway")) == 502
+    assert get_http_status(ValueError("no status")) is None
+
+
+def test_token_bucket_below_one_per_second(monkeypatch):
+    clock = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        # a bucket that can never hold a whole token would wait forever
+        assert len(slept) < 10
+        slept.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(time, "sleep", sleep)
+
+    bucket = TokenBucket(rate=0.5)
+    bucket.acquire()
+    bucket.acquire()
+
+    assert slept == [pytest.approx(2.0)]
+
+
+def test_spotify_client_honors_retry_after(monkeypatch, sleeps):
+    # the 429 is faked below urllib3's retry handling, so any retry adapter the client mounts would still swallow it
+    pytest.importorskip("spotipy")
+    pytest.importorskip("yt_dlp")
+    from urllib3.connectionpool import HTTPConnectionPool
+    from urllib3.response import HTTPResponse
+    from playlist_master.downloader import _get_spotify_client
+
+    responses = [
+        (429, {"Retry-After": "3"}, {"error": {"status": 429, "message": "rate limited"}}),
+        (200, {}, {"items": [], "total": 0})
+    ]
+
+    def make_request(self, conn, method, url, *args, **kwargs):
+        status, headers, body = responses.pop(0)
+        return HTTPResponse(
+            body=io.BytesIO(json.dumps(body).encode()),
+            status=status,
+            headers={"Content-Type": "application/json", **headers},
+            preload_content=False,
+            request_method=method,
+            request_url=url
+        )
+
+    monkeypatch.setattr(HTTPConnectionPool, "_make_request", make_request)
+    spotify = _get_spotify_client.__wrapped__("client_id", "client_secret")
+    monkeypatch.setattr(spotify, "_auth_headers", lambda: {})
+
+    assert with_backoff(spotify.playlist_items)("37i9dQZF1DXcBWIGoYBM5M") == {"items": [], "total": 0}
+    assert sleeps == [3.0]